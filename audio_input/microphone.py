@@ -7,29 +7,40 @@ Usage (manual test):
 
 from __future__ import annotations
 
-import math
+import logging
+import os
 import time
 import wave
 from pathlib import Path
 from typing import Optional, Generator
 
-try:
-    import pyaudio
-except ModuleNotFoundError as exc:  # pragma: no cover - import-time guard
-    raise ModuleNotFoundError(
-        "PyAudio is required for microphone capture. "
-        "Install system PortAudio headers (e.g. `brew install portaudio`) "
-        "then run `pip install pyaudio`."
-    ) from exc
-
-from core import AudioChunk, IAudioInput
+from core import AudioChunk, AudioChunkNT, IAudioInput
 from core.logging_utils import get_logger, log_activity
 
 logger = get_logger(__name__)
 
 
+def _import_pyaudio():
+    """Import PyAudio on first use so importing this module stays cheap."""
+    try:
+        import pyaudio
+    except ModuleNotFoundError as exc:  # pragma: no cover - runtime guard
+        raise ModuleNotFoundError(
+            "PyAudio is required for microphone capture. "
+            "Install system PortAudio headers (e.g. `brew install portaudio`) "
+            "then run `pip install pyaudio`."
+        ) from exc
+    return pyaudio
+
+
 class MicrophoneInput(IAudioInput):
-    """Capture audio from the default system microphone."""
+    """
+    Capture audio from the default system microphone.
+
+    Pass `fast_path=True` to have `stream()` yield lightweight AudioChunkNT
+    tuples instead of AudioChunk dataclasses; `record()` always returns an
+    AudioChunk.
+    """
 
     def __init__(
         self,
@@ -38,10 +49,13 @@ class MicrophoneInput(IAudioInput):
         channels: int = 1,
         chunk_size: int = 4_096,
         format_: Optional[int] = None,
+        fast_path: bool = False,
     ) -> None:
         self.sample_rate = sample_rate
         self.channels = channels
         self.chunk_size = chunk_size
+        self.fast_path = fast_path
+        pyaudio = _import_pyaudio()
         self._pyaudio = pyaudio.PyAudio()
         self._stream = None
         self._format = format_ if format_ is not None else pyaudio.paInt16
@@ -59,7 +73,7 @@ class MicrophoneInput(IAudioInput):
             *,
             max_chunks: Optional[int] = None,
             duration_seconds: Optional[float] = None,
-    ) -> Generator[AudioChunk, None, None]:
+    ) -> Generator[AudioChunk | AudioChunkNT, None, None]:
         logger.info(
             "Opening live microphone stream sample_rate=%s channels=%s chunk_size=%s max_chunks=%s duration_seconds=%s",
             self.sample_rate,
@@ -78,32 +92,38 @@ class MicrophoneInput(IAudioInput):
 
         try:
             chunks_yielded = 0
-            start_time = time.time()
+            # Bind loop invariants to locals; this loop runs once per read.
+            read = stream.read
+            now = time.time
+            chunk_size = self.chunk_size
+            sample_rate = self.sample_rate
+            channels = self.channels
+            sample_width = self.sample_width
+            chunk_type = AudioChunkNT if self.fast_path else AudioChunk
+            start_time = now()
             while True:
                 if max_chunks is not None and chunks_yielded >= max_chunks:
                     break
 
-                timestamp = time.time()
+                timestamp = now()
                 if (
                     duration_seconds is not None
                     and (timestamp - start_time) >= duration_seconds
                 ):
                     break
 
-                chunk = stream.read(self.chunk_size, exception_on_overflow=False)
-                logger.debug(
-                    "Captured chunk #%s bytes=%s timestamp=%s",
-                    chunks_yielded + 1,
-                    len(chunk),
-                    timestamp,
-                )
-                yield AudioChunk(
-                    data=chunk,
-                    sample_rate=self.sample_rate,
-                    timestamp=timestamp,
-                    channels=self.channels,
-                    sample_width=self.sample_width,
-                )
+                # PyAudio returns a fresh bytes object per read, so yield it
+                # as-is. Recycling pooled buffers would add a copy here and is
+                # unsafe because callers keep chunks (see save_stream_wav).
+                chunk = read(chunk_size, exception_on_overflow=False)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Captured chunk #%s bytes=%s timestamp=%s",
+                        chunks_yielded + 1,
+                        len(chunk),
+                        timestamp,
+                    )
+                yield chunk_type(chunk, sample_rate, timestamp, channels, sample_width)
                 chunks_yielded += 1
         finally:
             stream.stop_stream()
@@ -122,7 +142,6 @@ class MicrophoneInput(IAudioInput):
             input=True,
             frames_per_buffer=self.chunk_size,
         )
-        buffer = bytearray()
         timestamp = time.time()
 
         with log_activity(
@@ -131,19 +150,30 @@ class MicrophoneInput(IAudioInput):
             details={"duration_seconds": duration_seconds, "chunk_size": self.chunk_size},
         ):
             try:
-                num_chunks = math.ceil(
-                    duration_seconds * self.sample_rate / self.chunk_size
+                frames_needed = max(int(duration_seconds * self.sample_rate), 1)
+                num_chunks = (frames_needed + self.chunk_size - 1) // self.chunk_size
+                # The total size is known up front, so write each chunk into a
+                # single preallocated buffer instead of growing a bytearray.
+                buffer = bytearray(
+                    num_chunks * self.chunk_size * self.sample_width * self.channels
                 )
+                view = memoryview(buffer)
+                offset = 0
+                read = stream.read
+                chunk_size = self.chunk_size
                 for _ in range(num_chunks):
-                    chunk = stream.read(self.chunk_size, exception_on_overflow=False)
-                    buffer.extend(chunk)
+                    chunk = read(chunk_size, exception_on_overflow=False)
+                    view[offset:offset + len(chunk)] = chunk
+                    offset += len(chunk)
+                data = view[:offset].tobytes()
             finally:
                 stream.stop_stream()
                 stream.close()
-                logger.debug("Closed fixed-duration recording stream")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Closed fixed-duration recording stream")
 
         audio_chunk = AudioChunk(
-            data=bytes(buffer),
+            data=data,
             sample_rate=self.sample_rate,
             timestamp=timestamp,
             channels=self.channels,
@@ -173,19 +203,21 @@ class MicrophoneInput(IAudioInput):
     @staticmethod
     def save_wav(audio: AudioChunk, path: Path) -> None:
         """Persist an AudioChunk to a WAV file for manual testing."""
+        spath = os.fspath(path)
         logger.info(
             "Saving WAV path=%s sample_rate=%s channels=%s sample_width=%s bytes=%s",
-            path,
+            spath,
             audio.sample_rate,
             audio.channels,
             audio.sample_width,
             len(audio.data),
         )
-        with wave.open(str(path), "wb") as wav_file:
+        with wave.open(spath, "wb") as wav_file:
             wav_file.setnchannels(audio.channels)
             wav_file.setsampwidth(audio.sample_width)
             wav_file.setframerate(audio.sample_rate)
-            wav_file.writeframes(audio.data)
+            wav_file.setnframes(len(audio.data) // (audio.channels * audio.sample_width))
+            wav_file.writeframesraw(audio.data)
 
     @staticmethod
     def save_stream_wav(
@@ -193,19 +225,25 @@ class MicrophoneInput(IAudioInput):
     ) -> None:
         if not chunks:
             raise ValueError("No audio chunks to save.")
+        spath = os.fspath(path)
         logger.info(
             "Saving streamed WAV path=%s chunks=%s",
-            path,
+            spath,
             len(chunks),
         )
 
         first_chunk = chunks[0]
-        with wave.open(str(path), "wb") as wav_file:
+        payload = b"".join(chunk.data for chunk in chunks)
+        with wave.open(spath, "wb") as wav_file:
             wav_file.setnchannels(first_chunk.channels)
             wav_file.setsampwidth(first_chunk.sample_width)
             wav_file.setframerate(first_chunk.sample_rate)
-            for chunk in chunks:
-                wav_file.writeframes(chunk.data)
+            # Declaring nframes up front lets `wave` write the final header
+            # once instead of patching it after the data.
+            wav_file.setnframes(
+                len(payload) // (first_chunk.channels * first_chunk.sample_width)
+            )
+            wav_file.writeframesraw(payload)
 
 
 def _prompt_and_record(output_path: Path) -> None:
@@ -9,44 +9,158 @@ microphone audio chunks with lower perceived latency.
 from __future__ import annotations
 
 import audioop
-import base64
+import binascii
 import io
 import os
 import json
+import logging
+import selectors
+import time
 import wave
+from collections import deque
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Generator, Iterable, Optional
 from urllib.parse import urlencode
 
-from openai import OpenAI
-
-try:  # pragma: no cover - optional dependency
-    import websocket  # type: ignore
-    from websocket import (  # type: ignore
-        WebSocketConnectionClosedException,
-        WebSocketTimeoutException,
-        WebSocketBadStatusException,
-    )
-except ModuleNotFoundError:  # pragma: no cover - handled at runtime
-    websocket = None  # type: ignore
-    WebSocketConnectionClosedException = None  # type: ignore
-    WebSocketTimeoutException = None  # type: ignore
-    WebSocketBadStatusException = None  # type: ignore
+import orjson
 
 from core import AudioChunk, ISTTEngine, TranscribedText
+from core.clients import openai_client
 from core.config import get_config
 from core.logging_utils import get_logger, log_activity
 
 logger = get_logger(__name__)
 
+# Left as None, STTOpenAI uses the process-wide client from core.clients;
+# set it to a client class to give each engine its own client instead.
+OpenAI = None  # type: ignore[assignment]
+# websocket-client is imported on first use (see _import_websocket) so
+# importing this module stays cheap.
+websocket = None  # type: ignore[assignment]
+WebSocketConnectionClosedException = None  # type: ignore[assignment]
+WebSocketTimeoutException = None  # type: ignore[assignment]
+WebSocketBadStatusException = None  # type: ignore[assignment]
 
-def _char_count(value: object) -> int:
-    if value is None:
-        return 0
-    try:
-        return len(value)  # type: ignore[arg-type]
-    except TypeError:
-        return len(str(value))
+
+_REALTIME_SAMPLE_RATE = 24_000
+# Readiness is polled with a selector, so the socket timeout only bounds a
+# blocked send or a frame that stalls mid-read.
+_SOCKET_TIMEOUT_S = 10.0
+# The final wait gives up once the server has been silent this long.
+_FINAL_IDLE_TIMEOUT_S = 10.0
+
+# Stable realtime payloads are serialized once. Append messages only vary in
+# their base64 audio, which never needs JSON escaping, so they are assembled
+# from a fixed prefix/suffix instead of going through json.dumps per batch.
+_COMMIT_MESSAGE = json.dumps({"type": "input_audio_buffer.commit"})
+_APPEND_PREFIX = '{"type": "input_audio_buffer.append", "audio": "'
+_APPEND_SUFFIX = '"}'
+
+# WAV files at least this large are replayed through the realtime socket,
+# committing every few seconds of audio, so the server transcribes earlier
+# segments while later ones are still uploading.
+_REALTIME_FILE_MIN_BYTES = 1 << 20
+_FILE_CHUNK_FRAMES = 4_096
+_FILE_COMMIT_INTERVAL_S = 5.0
+
+
+def _import_websocket():
+    global websocket
+    global WebSocketConnectionClosedException, WebSocketTimeoutException, WebSocketBadStatusException
+    if websocket is None:
+        try:
+            import websocket as websocket_module  # type: ignore
+        except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError(
+                "websocket-client is required for realtime transcription. "
+                "Install it with `pip install websocket-client`."
+            ) from exc
+
+        websocket = websocket_module
+        WebSocketConnectionClosedException = websocket_module.WebSocketConnectionClosedException
+        WebSocketTimeoutException = websocket_module.WebSocketTimeoutException
+        WebSocketBadStatusException = websocket_module.WebSocketBadStatusException
+    return websocket
+
+
+def _merge_transcript(current: str, incoming: str, is_final: bool) -> str:
+    """Fold a realtime transcription event into the running item transcript.
+
+    Deltas are appended; the completed event carries the full item text and
+    replaces whatever was accumulated so far.
+    """
+    if is_final:
+        return incoming
+    return current + incoming
+
+
+def _encode_audio(data: bytes) -> str:
+    # b2a_base64 skips the wrapper work of base64.b64encode and, with
+    # newline=False, the trailing newline we would otherwise strip.
+    return binascii.b2a_base64(data, newline=False).decode("ascii")
+
+
+def _to_realtime_pcm(
+    chunk: AudioChunk, state: Optional[tuple]
+) -> tuple[bytes, Optional[tuple]]:
+    """Convert a chunk to the 24 kHz mono PCM16 the Realtime API expects.
+
+    `state` is the audioop.ratecv filter state from the previous chunk; carry
+    it across calls so resampling stays continuous at chunk boundaries.
+    """
+    data = chunk.data
+    if chunk.sample_width != 2:
+        data = audioop.lin2lin(data, chunk.sample_width, 2)
+    if chunk.channels == 2:
+        data = audioop.tomono(data, 2, 0.5, 0.5)
+    elif chunk.channels != 1:
+        raise ValueError(f"Unsupported channel count for realtime STT: {chunk.channels}")
+    if chunk.sample_rate != _REALTIME_SAMPLE_RATE:
+        data, state = audioop.ratecv(
+            data, 2, 1, chunk.sample_rate, _REALTIME_SAMPLE_RATE, state
+        )
+    return data, state
+
+
+def _iter_wav_chunks(
+    path: Path, frames_per_chunk: int = _FILE_CHUNK_FRAMES
+) -> Generator[AudioChunk, None, None]:
+    """Read a WAV file lazily as AudioChunks, like a microphone stream."""
+    with wave.open(os.fspath(path), "rb") as wav_file:
+        sample_rate = wav_file.getframerate()
+        channels = wav_file.getnchannels()
+        sample_width = wav_file.getsampwidth()
+        read = wav_file.readframes
+        while data := read(frames_per_chunk):
+            if sample_width == 1:
+                # 8-bit WAV PCM is unsigned; audioop expects signed samples.
+                data = audioop.bias(data, 1, -128)
+            yield AudioChunk(
+                data=data,
+                sample_rate=sample_rate,
+                timestamp=time.time(),
+                channels=channels,
+                sample_width=sample_width,
+            )
+
+
+@dataclass
+class _RealtimeTranscript:
+    """Bookkeeping for a single realtime transcription session."""
+
+    items: dict[str, str] = field(default_factory=dict)
+    pending_items: set[str] = field(default_factory=set)
+    pending_commits: int = 0
+    language: Optional[str] = None
+
+    @property
+    def text(self) -> str:
+        return " ".join(part.strip() for part in self.items.values() if part.strip())
+
+    @property
+    def settled(self) -> bool:
+        return not self.pending_commits and not self.pending_items
 
 
 class STTOpenAI(ISTTEngine):
@@ -57,6 +171,8 @@ class STTOpenAI(ISTTEngine):
         *,
         transcription_model: str = "gpt-4o-transcribe",
         realtime_model: str = "gpt-4o-realtime-preview",
+        append_batch_ms: int = 200,
+        append_max_delay_s: float = 0.04,
     ) -> None:
         config = get_config()
         self.api_key = config.openai_api_key
@@ -67,9 +183,18 @@ class STTOpenAI(ISTTEngine):
                 "OpenAI API key missing. Add it to config.local.json under `openai.api_key`."
             )
 
-        self._client = OpenAI(api_key=self.api_key, organization=self.organization)
+        if OpenAI is not None:
+            self._client = OpenAI(api_key=self.api_key, organization=self.organization)
+        else:
+            self._client = openai_client()
         self.transcription_model = transcription_model
         self.realtime_model = realtime_model
+        # Realtime audio is coalesced into one append per batch; see
+        # stream_transcribe for the flush rules.
+        self.append_batch_ms = append_batch_ms
+        self.append_max_delay_s = append_max_delay_s
+        # Outgoing audio is always 24 kHz mono PCM16 (see _to_realtime_pcm).
+        self._append_batch_bytes = append_batch_ms * _REALTIME_SAMPLE_RATE * 2 // 1000
         query = urlencode({"model": self.realtime_model})
         self._realtime_url = f"wss://api.openai.com/v1/realtime?{query}"
         logger.info(
@@ -87,6 +212,31 @@ class STTOpenAI(ISTTEngine):
     def transcribe(self, audio: AudioChunk) -> TranscribedText:
         ...
 
+    def transcribe_chunk(self, chunk: AudioChunk) -> TranscribedText:
+        """Transcribe an in-memory chunk without writing a WAV file to disk."""
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wav_file:
+            wav_file.setnchannels(chunk.channels)
+            wav_file.setsampwidth(chunk.sample_width)
+            wav_file.setframerate(chunk.sample_rate)
+            wav_file.setnframes(len(chunk.data) // (chunk.channels * chunk.sample_width))
+            wav_file.writeframesraw(chunk.data)
+
+        with log_activity(
+            logger,
+            "stt.transcribe_chunk",
+            details={"model": self.transcription_model, "bytes": len(chunk.data)},
+        ):
+            response = self._client.audio.transcriptions.create(
+                model=self.transcription_model,
+                file=("audio.wav", buffer.getvalue(), "audio/wav"),
+            )
+        text = response.text or ""
+        logger.info("Received chunk transcript chars=%s", len(text))
+        return TranscribedText(
+            text=text, confidence=1.0, language=getattr(response, "language", None)
+        )
+
     def stream_transcribe_file(
         self,
         audio_path: Path,
@@ -95,10 +245,33 @@ class STTOpenAI(ISTTEngine):
         language: Optional[str] = None,
         prompt: Optional[str] = None,
     ) -> Generator[TranscribedText, None, TranscribedText]:
+        """
+        Stream a transcript for an audio file.
 
-        from openai import OpenAI
-        client = OpenAI(api_key=self.api_key)
+        Large WAV files are replayed chunk by chunk through
+        `stream_transcribe`, the same path microphone audio takes; anything
+        else is uploaded to the streaming transcription endpoint. Either way
+        the running transcript is yielded as it grows and the final one is
+        returned.
+        """
+        model = model or "gpt-4o-mini-transcribe"
+        resolved_path = Path.joinpath(Path(__file__).parent.parent, "core", audio_path)
+        if (
+            resolved_path.suffix.lower() == ".wav"
+            and resolved_path.stat().st_size >= _REALTIME_FILE_MIN_BYTES
+        ):
+            logger.info("Streaming WAV file over realtime path=%s", resolved_path)
+            return (
+                yield from self.stream_transcribe(
+                    _iter_wav_chunks(resolved_path),
+                    instructions=prompt or "Transcribe the provided audio into text only.",
+                    language=language,
+                    transcription_model=model,
+                    commit_every_s=_FILE_COMMIT_INTERVAL_S,
+                )
+            )
 
+        text = ""
         with log_activity(
             logger,
             "stt.stream_transcribe_file",
@@ -106,30 +279,32 @@ class STTOpenAI(ISTTEngine):
                 "audio_path": str(audio_path),
                 "language": language or "auto",
                 "prompt_supplied": bool(prompt),
-                "model": model or "gpt-4o-mini-transcribe",
+                "model": model,
             },
         ):
-            audio_file = open(Path.joinpath(Path(__file__).parent.parent, "core", audio_path), "rb")
-            stream = client.audio.transcriptions.create(
-                file=audio_file,
-                model="gpt-4o-mini-transcribe",
-                language=language,
-                stream=True
-            )
+            with open(resolved_path, "rb") as audio_file:
+                stream = self._client.audio.transcriptions.create(
+                    file=audio_file,
+                    model=model,
+                    language=language,
+                    stream=True
+                )
 
             for event in stream:
                 if event.type == "transcript.text.delta":
-                    logger.debug(
-                        "Received partial transcript chars=%s",
-                        _char_count(event.delta),
-                    )
-                    yield TranscribedText(text=event.delta, confidence=1.0)
+                    delta = event.delta or ""
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Received partial transcript chars=%s", len(delta))
+                    text = _merge_transcript(text, delta, False)
+                    yield TranscribedText(text=text, confidence=1.0, language=language)
                 elif event.type == "transcript.text.done":
-                    logger.info(
-                        "Received final transcript chars=%s",
-                        _char_count(event.text),
-                    )
-                    yield TranscribedText(text=event.text, confidence=1.0)
+                    final_text = event.text or ""
+                    logger.info("Received final transcript chars=%s", len(final_text))
+                    if final_text != text:
+                        text = _merge_transcript(text, final_text, True)
+                        yield TranscribedText(text=text, confidence=1.0, language=language)
+
+        return TranscribedText(text=text, confidence=1.0, language=language)
 
     # ------------------------------------------------------------------
     # Realtime streaming
@@ -141,5 +316,232 @@ class STTOpenAI(ISTTEngine):
         instructions: str = "Transcribe the provided audio into text only.",
         language: Optional[str] = None,
         commit_every_chunk: bool = False,
+        commit_every_s: Optional[float] = None,
+        transcription_model: Optional[str] = None,
     ) -> Generator[TranscribedText, None, TranscribedText]:
-        ... 
+        """
+        Forward audio chunks over the Realtime WebSocket API.
+
+        Yields the running transcript whenever a delta or completed event
+        arrives and returns the final transcript once every commit settled.
+        `transcription_model` overrides the engine's `transcription_model` for
+        this session.
+
+        Without turn detection nothing is transcribed until a commit, so
+        `commit_every_s` commits each time that much audio has been appended,
+        letting long inputs transcribe while they are still uploading.
+
+        Chunks are buffered and sent as a single append once `append_batch_ms`
+        of audio is buffered, once the oldest buffered chunk is
+        `append_max_delay_s` old, or before each commit. Sources slower than
+        the delay budget (e.g. 4096-frame microphone reads) are flushed on
+        arrival so batching never adds latency to them.
+        """
+        ws_module = _import_websocket()
+
+        headers = [f"Authorization: Bearer {self.api_key}"]
+        if self.organization:
+            headers.append(f"OpenAI-Organization: {self.organization}")
+
+        model = transcription_model or self.transcription_model
+        transcript = _RealtimeTranscript(language=language)
+        with log_activity(
+            logger,
+            "stt.stream_transcribe",
+            details={
+                "model": model,
+                "language": language or "auto",
+                "commit_every_chunk": commit_every_chunk,
+            },
+        ):
+            ws = ws_module.create_connection(self._realtime_url, header=headers)
+            # The timeout is set once per session. Reads wait on `selector`
+            # instead, so a backed-up uplink blocks a send rather than
+            # aborting it after a short read timeout.
+            ws.settimeout(_SOCKET_TIMEOUT_S)
+            selector = selectors.DefaultSelector()
+            selector.register(ws.sock, selectors.EVENT_READ)
+            try:
+                ws.send(json.dumps(self._session_update(instructions, language, model)))
+                resample_state = None
+                chunks_sent = 0
+                pending: deque[bytes] = deque()
+                pending_bytes = 0
+                commit_bytes = (
+                    int(commit_every_s * _REALTIME_SAMPLE_RATE) * 2 if commit_every_s else 0
+                )
+                uncommitted_bytes = 0
+                pending_since = last_arrival = time.monotonic()
+                for chunk in audio_stream:
+                    pcm, resample_state = _to_realtime_pcm(chunk, resample_state)
+                    now = time.monotonic()
+                    if not pending:
+                        pending_since = now
+                    pending.append(pcm)
+                    pending_bytes += len(pcm)
+                    uncommitted_bytes += len(pcm)
+                    chunks_sent += 1
+                    commit = commit_every_chunk or (
+                        commit_bytes and uncommitted_bytes >= commit_bytes
+                    )
+                    if (
+                        commit
+                        or pending_bytes >= self._append_batch_bytes
+                        or now - pending_since >= self.append_max_delay_s
+                        or now - last_arrival >= self.append_max_delay_s
+                    ):
+                        self._flush_audio(ws, pending)
+                        pending_bytes = 0
+                    last_arrival = now
+                    if commit:
+                        ws.send(_COMMIT_MESSAGE)
+                        transcript.pending_commits += 1
+                        uncommitted_bytes = 0
+                    yield from self._receive_events(ws, selector, transcript)
+
+                self._flush_audio(ws, pending)
+                ws.send(_COMMIT_MESSAGE)
+                transcript.pending_commits += 1
+                yield from self._receive_events(
+                    ws, selector, transcript, idle_timeout=_FINAL_IDLE_TIMEOUT_S
+                )
+            finally:
+                selector.close()
+                ws.close()
+
+        logger.info(
+            "Realtime transcription finished chunks=%s chars=%s",
+            chunks_sent,
+            len(transcript.text),
+        )
+        return TranscribedText(text=transcript.text, confidence=1.0, language=language)
+
+    @staticmethod
+    def _flush_audio(ws: Any, pending: deque[bytes]) -> None:
+        """Send every buffered PCM chunk as one base64 append message."""
+        if not pending:
+            return
+        payload = pending[0] if len(pending) == 1 else b"".join(pending)
+        pending.clear()
+        ws.send(_APPEND_PREFIX + _encode_audio(payload) + _APPEND_SUFFIX)
+
+    @staticmethod
+    def _session_update(
+        instructions: str, language: Optional[str], model: str
+    ) -> dict[str, Any]:
+        transcription: dict[str, Any] = {
+            "model": model,
+            "prompt": instructions,
+        }
+        if language:
+            transcription["language"] = language
+        return {
+            "type": "session.update",
+            "session": {
+                "type": "transcription",
+                "audio": {
+                    "input": {
+                        "format": {"type": "audio/pcm", "rate": _REALTIME_SAMPLE_RATE},
+                        "transcription": transcription,
+                        "turn_detection": None,
+                    }
+                },
+            },
+        }
+
+    @staticmethod
+    def _wait_readable(ws: Any, selector: selectors.BaseSelector, timeout: float) -> bool:
+        # TLS sockets may already hold decrypted bytes the selector cannot see.
+        pending = getattr(ws.sock, "pending", None)
+        if pending is not None and pending():
+            return True
+        return bool(selector.select(timeout))
+
+    def _receive_events(
+        self,
+        ws: Any,
+        selector: selectors.BaseSelector,
+        transcript: _RealtimeTranscript,
+        *,
+        idle_timeout: Optional[float] = None,
+    ) -> Generator[TranscribedText, None, None]:
+        """
+        Consume server events until none are ready (no `idle_timeout`) or
+        until every outstanding commit has been transcribed. With an
+        `idle_timeout` the wait only gives up after that long without any
+        server event, so a long transcript that keeps streaming is not cut off.
+        """
+        wait = idle_timeout is not None
+        deadline = time.monotonic() + idle_timeout if wait else 0.0
+        while not (wait and transcript.settled):
+            timeout = max(deadline - time.monotonic(), 0.0) if wait else 0.0
+            ready = self._wait_readable(ws, selector, timeout)
+            if ready:
+                try:
+                    raw = ws.recv()
+                except WebSocketTimeoutException:
+                    # A frame stalled mid-read; treat it like an idle poll.
+                    ready = False
+                except WebSocketConnectionClosedException:
+                    logger.warning("Realtime connection closed by server")
+                    return
+            if not ready:
+                # Timeouts before the deadline are heartbeats: keep waiting.
+                if wait and time.monotonic() < deadline:
+                    continue
+                if wait:
+                    logger.warning(
+                        "Timed out waiting for realtime transcript pending_items=%s",
+                        len(transcript.pending_items),
+                    )
+                return
+            if not raw:
+                return
+            if wait:
+                deadline = time.monotonic() + idle_timeout
+
+            event = orjson.loads(raw)
+            event_type = event.get("type")
+            if event_type == "input_audio_buffer.committed":
+                transcript.pending_commits = max(transcript.pending_commits - 1, 0)
+                item_id = event["item_id"]
+                transcript.items.setdefault(item_id, "")
+                transcript.pending_items.add(item_id)
+            elif event_type == "conversation.item.input_audio_transcription.delta":
+                item_id = event["item_id"]
+                delta = event.get("delta") or ""
+                transcript.items[item_id] = _merge_transcript(
+                    transcript.items.get(item_id, ""), delta, False
+                )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Received realtime delta chars=%s", len(delta))
+                yield TranscribedText(
+                    text=transcript.text, confidence=1.0, language=transcript.language
+                )
+            elif event_type == "conversation.item.input_audio_transcription.completed":
+                item_id = event["item_id"]
+                final_text = event.get("transcript") or ""
+                transcript.items[item_id] = _merge_transcript(
+                    transcript.items.get(item_id, ""), final_text, True
+                )
+                transcript.pending_items.discard(item_id)
+                logger.info(
+                    "Received realtime transcript item=%s chars=%s",
+                    item_id,
+                    len(final_text),
+                )
+                yield TranscribedText(
+                    text=transcript.text, confidence=1.0, language=transcript.language
+                )
+            elif event_type == "conversation.item.input_audio_transcription.failed":
+                transcript.pending_items.discard(event.get("item_id"))
+                logger.warning("Realtime transcription failed item=%s", event.get("item_id"))
+            elif event_type == "error":
+                error = event.get("error") or {}
+                if error.get("code") == "input_audio_buffer_commit_empty":
+                    transcript.pending_commits = max(transcript.pending_commits - 1, 0)
+                logger.warning(
+                    "Realtime API error code=%s message=%s",
+                    error.get("code"),
+                    error.get("message"),
+                )
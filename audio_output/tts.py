@@ -1,11 +1,14 @@
 
 from pathlib import Path
 
-from core.config import get_config
+from core.clients import elevenlabs_client, openai_client
 from core.logging_utils import get_logger, log_activity
 
 logger = get_logger(__name__)
 
+_STREAM_CHUNK_SIZE = 8_192
+SPEECH_FILE_PATH = Path(__file__).parent / "speech.mp3"
+
 
 def _preview(text: str, limit: int = 80) -> str:
     normalized = " ".join(text.split())
@@ -13,12 +16,9 @@ def _preview(text: str, limit: int = 80) -> str:
 
 
 def generate_speech(text: str) -> None:
-    from openai import OpenAI
-
     instructions = """Voice: Warm, empathetic, and professional, reassuring the customer that their issue is understood and will be resolved.\n\nPunctuation: Well-structured with natural pauses, allowing for clarity and a steady, calming flow.\n\nDelivery: Calm and patient, with a supportive and understanding tone that reassures the listener.\n\nPhrasing: Clear and concise, using customer-friendly language that avoids jargon while maintaining professionalism.\n\nTone: Empathetic and solution-focused, emphasizing both understanding and proactive assistance."""
-    config = get_config()
-    client = OpenAI(api_key=config.openai_api_key)
-    speech_file_path = Path(__file__).parent / "speech.mp3"
+    client = openai_client()
+    speech_file_path = SPEECH_FILE_PATH
 
     with log_activity(
         logger,
@@ -32,16 +32,14 @@ def generate_speech(text: str) -> None:
             instructions=instructions,
         ) as response:
             logger.info("Streaming TTS audio chunk preview=%s", _preview(text))
-            response.stream_to_file(speech_file_path)
+            with speech_file_path.open("wb") as speech_file:
+                for chunk in response.iter_bytes(_STREAM_CHUNK_SIZE):
+                    speech_file.write(chunk)
 
 
-def generate_speech_elevenlabs(text: str) -> None:
-    from elevenlabs.client import ElevenLabs
-    from elevenlabs import save
-
-    client = ElevenLabs(
-        api_key=get_config().elevenlabs_api_key
-    )
+def synthesize_speech_elevenlabs(text: str) -> bytes:
+    """Synthesize `text` with ElevenLabs and return the MP3 bytes."""
+    client = elevenlabs_client()
 
     with log_activity(
         logger,
@@ -56,5 +54,10 @@ def generate_speech_elevenlabs(text: str) -> None:
             output_format="mp3_44100_128",
         )
 
+        audio_bytes = audio if isinstance(audio, bytes) else b"".join(audio)
         logger.info("Received ElevenLabs audio buffer preview=%s", _preview(text))
-        save(audio, Path(__file__).parent / "speech.mp3")
+    return audio_bytes
+
+
+def generate_speech_elevenlabs(text: str) -> None:
+    SPEECH_FILE_PATH.write_bytes(synthesize_speech_elevenlabs(text))
@@ -2,6 +2,7 @@
 
 from .interfaces import (
     AudioChunk,
+    AudioChunkNT,
     TranscribedText,
     SynthesizedAudio,
     ToolResult,
@@ -13,6 +14,7 @@ from .interfaces import (
 
 __all__ = [
     "AudioChunk",
+    "AudioChunkNT",
     "TranscribedText",
     "SynthesizedAudio",
     "ToolResult",
@@ -0,0 +1,68 @@
+"""
+Process-wide API clients shared by every pipeline stage.
+
+Each SDK client owns an HTTP connection pool; building one per call pays a
+fresh TCP/TLS handshake every turn. These factories construct each client
+once and hand back the same instance afterwards.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from functools import cache
+from typing import TYPE_CHECKING
+
+from core.config import get_config
+from core.logging_utils import get_logger
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from elevenlabs.client import ElevenLabs
+    from openai import AsyncOpenAI, OpenAI
+
+logger = get_logger(__name__)
+
+# (loop, client) for the most recent event loop; see async_openai_client.
+_ASYNC_OPENAI: tuple[asyncio.AbstractEventLoop, "AsyncOpenAI"] | None = None
+
+
+@cache
+def openai_client() -> "OpenAI":
+    """Return the shared OpenAI client used by both STT and TTS."""
+    from openai import OpenAI
+
+    config = get_config()
+    logger.debug("Creating shared OpenAI client")
+    return OpenAI(
+        api_key=config.openai_api_key,
+        organization=config.openai_organization or None,
+    )
+
+
+def async_openai_client() -> "AsyncOpenAI":
+    """
+    Return the AsyncOpenAI client bound to the running event loop.
+
+    Its connection pool cannot outlive the loop it was created on, so a new
+    client is built whenever the running loop changes (e.g. each
+    `asyncio.run()` of a turn loop). Call it from inside a coroutine.
+    """
+    global _ASYNC_OPENAI
+    loop = asyncio.get_running_loop()
+    if _ASYNC_OPENAI is None or _ASYNC_OPENAI[0] is not loop:
+        from openai import AsyncOpenAI
+
+        logger.debug("Creating AsyncOpenAI client for the running event loop")
+        _ASYNC_OPENAI = (loop, AsyncOpenAI(api_key=get_config().openai_api_key))
+    return _ASYNC_OPENAI[1]
+
+
+@cache
+def elevenlabs_client() -> "ElevenLabs":
+    """Return the shared ElevenLabs client."""
+    from elevenlabs.client import ElevenLabs
+
+    logger.debug("Creating shared ElevenLabs client")
+    return ElevenLabs(api_key=get_config().elevenlabs_api_key)
+
+
+__all__ = ["async_openai_client", "elevenlabs_client", "openai_client"]
@@ -1,5 +1,6 @@
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 
 from core.logging_utils import get_logger
@@ -17,12 +18,15 @@ def _find_project_root() -> Path:
     return Path(__file__).parent.parent
 
 
+# The project root cannot change while the process runs, so resolve it once.
+_PROJECT_ROOT = _find_project_root()
+
+
 class Config:
     def __init__(self, config_file: str | None = None) -> None:
         self.config_data = {}
         if config_file is None:
-            project_root = _find_project_root()
-            config_file = project_root / "config.local.json"
+            config_file = _PROJECT_ROOT / "config.local.json"
         else:
             config_file = Path(config_file)
 
@@ -54,6 +58,12 @@ class Config:
         return self.config_data.get("openai", {}).get("organization", "")
 
 
+@lru_cache(maxsize=1)
 def get_config() -> Config:
+    """
+    Return the process-wide Config, loading it on first use.
+
+    Call `get_config.cache_clear()` to force a reload (e.g. in tests).
+    """
     logger.debug("Creating Config instance")
     return Config()
@@ -8,10 +8,32 @@ pieces together without surprises at the end of the sprint.
 
 import abc
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Generator
+from typing import TYPE_CHECKING, Any, Dict, NamedTuple, Optional, Generator
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import numpy as np
 
-@dataclass(frozen=True)
+# NumPy dtype names for the PCM sample widths we capture (see AudioChunk).
+_PCM_DTYPES = {1: "uint8", 2: "<i2", 4: "<i4"}
+
+
+def _pcm_ndarray(data: bytes, channels: int, sample_width: int) -> "np.ndarray":
+    try:
+        import numpy as np
+    except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency
+        raise ModuleNotFoundError(
+            "NumPy is required for array views of audio. Run `pip install numpy`."
+        ) from exc
+
+    try:
+        dtype = _PCM_DTYPES[sample_width]
+    except KeyError:
+        raise ValueError(f"Unsupported sample width: {sample_width}") from None
+    samples = np.frombuffer(data, dtype=dtype)
+    return samples.reshape(-1, channels) if channels > 1 else samples
+
+
+@dataclass(frozen=True, slots=True)
 class AudioChunk:
     """Raw audio data captured from a microphone."""
 
@@ -36,8 +58,36 @@ class AudioChunk:
             sample_width=chunks[0].sample_width,
         )
 
+    def as_ndarray(self) -> "np.ndarray":
+        """
+        Return a zero-copy, read-only NumPy view over the PCM samples.
+
+        Mono audio yields a 1-D array; multi-channel audio is shaped
+        (frames, channels).
+        """
+        return _pcm_ndarray(self.data, self.channels, self.sample_width)
+
+
+class AudioChunkNT(NamedTuple):
+    """
+    Tuple-backed AudioChunk for per-read streaming hot paths.
+
+    Exposes the same fields as AudioChunk and is cheaper to construct, so
+    consumers that only read attributes can accept either type.
+    """
+
+    data: bytes
+    sample_rate: int
+    timestamp: float
+    channels: int = 1
+    sample_width: int = 2
+
+    def as_ndarray(self) -> "np.ndarray":
+        """Same as AudioChunk.as_ndarray."""
+        return _pcm_ndarray(self.data, self.channels, self.sample_width)
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TranscribedText:
     """Text produced by the speech-to-text system."""
 
@@ -46,7 +96,7 @@ class TranscribedText:
     language: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SynthesizedAudio:
     """Audio produced by the text-to-speech system."""
 
@@ -55,7 +105,7 @@ class SynthesizedAudio:
     voice: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolResult:
     """Normalized return value from any tool invoked by the LLM."""
 
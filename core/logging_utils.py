@@ -118,15 +118,15 @@ def setup_logging(level: str | int | None = None) -> None:
 def get_logger(name: str) -> logging.Logger:
     """Return a module-scoped logger with the shared configuration."""
 
-    setup_logging()
+    if not _CONFIGURED:
+        setup_logging()
     return logging.getLogger(name)
 
 
 def _format_details(details: dict[str, object] | None) -> str:
     if not details:
         return ""
-    serialized = " ".join(f"{key}={value}" for key, value in details.items())
-    return f" | {serialized}"
+    return " | " + " ".join([f"{key}={value}" for key, value in details.items()])
 
 
 @contextmanager
@@ -140,21 +140,31 @@ def log_activity(
     Emit structured start/end logs with execution timing.
 
     This is intentionally logging-only: exceptions are re-raised untouched so
-    runtime behavior stays identical.
+    runtime behavior stays identical. When INFO is disabled the timing and
+    START/END formatting are skipped; failures are still logged.
     """
 
+    if not logger.isEnabledFor(logging.INFO):
+        try:
+            yield
+        except Exception:
+            logger.exception("FAILED %s%s", activity, _format_details(details))
+            raise
+        return
+
+    # Serialize the details once; END only appends the duration to them.
+    formatted = _format_details(details)
     start = time.perf_counter()
-    logger.info("START %s%s", activity, _format_details(details))
+    logger.info("START %s%s", activity, formatted)
     try:
         yield
     except Exception:
-        logger.exception("FAILED %s%s", activity, _format_details(details))
+        logger.exception("FAILED %s%s", activity, formatted)
         raise
     else:
         elapsed = time.perf_counter() - start
-        data = dict(details or {})
-        data["duration_s"] = f"{elapsed:.3f}"
-        logger.info("END %s%s", activity, _format_details(data))
+        separator = " " if formatted else " | "
+        logger.info("END %s%s%sduration_s=%.3f", activity, formatted, separator, elapsed)
 
 
 __all__ = ["get_logger", "log_activity", "setup_logging"]
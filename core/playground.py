@@ -4,37 +4,62 @@ Ad-hoc playground helpers for experimenting with microphone capture and STT.
 Run this module directly to try the streaming transcription demo:
 
     python -m core.playground
+
+The demo runs STT -> LLM -> TTS as concurrent asyncio stages connected by
+queues, so speech synthesis starts on the first complete sentence instead of
+waiting for the whole answer.
 """
 
 from __future__ import annotations
 
+import asyncio
+import re
+from collections import deque
 from pathlib import Path
 
 from audio_input.microphone import MicrophoneInput
 from audio_output.stt import STTOpenAI
-from audio_output.tts import generate_speech, generate_speech_elevenlabs
+from audio_output.tts import SPEECH_FILE_PATH, generate_speech, synthesize_speech_elevenlabs
 from llm.openai import generate_answer
 from core.logging_utils import get_logger, log_activity
 
 logger = get_logger(__name__)
 
+_TTS_CONCURRENCY = 3
+# Bound the hand-off queues so a fast LLM cannot run arbitrarily far ahead of
+# speech synthesis; producers wait once this many items are outstanding.
+_PIPELINE_QUEUE_SIZE = 4
+# Flush unpunctuated text past roughly this many words (counted by spaces,
+# which avoids splitting the buffer into a list on every delta).
+_MAX_SENTENCE_WORDS = 80
+# Everything up to the last sentence terminator followed by whitespace, then the
+# remainder. A terminator at the end of the buffer is not a boundary yet: deltas
+# are token-sized, so "3" + "." + "14" must not flush "3.". The end-of-stream
+# flush in _llm_stage picks up a final sentence. Compiled once: runs per delta.
+_SENTENCE_SPLIT = re.compile(r"(.*[.?!])(?=\s)(.*)", re.DOTALL)
+
+# One STT engine per process so every demo reuses its HTTP connection pool.
+_STT: STTOpenAI | None = None
+
+
+def _stt() -> STTOpenAI:
+    """Return the playground's shared STT engine, creating it on first use."""
+    global _STT
+    if _STT is None:
+        _STT = STTOpenAI()
+    return _STT
+
 
 def example_batch_transcription() -> None:
-    """Capture audio, save to WAV, and run classic Whisper transcription."""
-    output_path = Path("vad_recording.wav")
-    with log_activity(
-        logger,
-        "playground.batch_transcription",
-        details={"output_path": str(output_path)},
-    ):
+    """Capture audio and transcribe it in one upload, without a WAV on disk."""
+    with log_activity(logger, "playground.batch_transcription"):
         with MicrophoneInput() as mic:
             print("Press Enter to record 5 seconds (batch transcription demo)...")
             input()
             audio_chunk = mic.record(duration_seconds=5.0)
-            MicrophoneInput.save_wav(audio_chunk, output_path)
 
-        stt = STTOpenAI()
-        result = stt.transcribe_path(output_path)
+        stt = _stt()
+        result = stt.transcribe_chunk(audio_chunk)
         print(f"[Batch] Transcript: {result.text}")
         logger.info(
             "Batch transcription complete chars=%s",
@@ -44,7 +69,7 @@ def example_batch_transcription() -> None:
 
 def example_streaming_transcription() -> None:
     """Stream microphone audio to OpenAI while recording and print partial transcripts."""
-    stt = STTOpenAI()
+    stt = _stt()
     with log_activity(logger, "playground.streaming_transcription"):
         with MicrophoneInput() as mic:
             print("Press Enter to start realtime transcription (~5 seconds)...")
@@ -67,15 +92,143 @@ def example_streaming_transcription() -> None:
             )
 
 
+def _take_sentences(buffer: str) -> tuple[str, str]:
+    """
+    Split `buffer` after its last complete sentence.
+
+    Returns `(sentences, remainder)`; `sentences` is empty until a sentence
+    terminator followed by whitespace shows up, so "Hi! How" flushes "Hi!"
+    even though the delta continued past it, while "costs 3." waits for the
+    next delta in case it continues as "3.14".
+    """
+    match = _SENTENCE_SPLIT.match(buffer)
+    if match is None:
+        return "", buffer
+    return match.group(1), match.group(2)
+
+
+async def _stt_stage(audio_path: Path, stt_q: asyncio.Queue[str]) -> None:
+    """Transcribe `audio_path` and hand the final transcript to the LLM stage."""
+
+    def transcribe() -> str:
+        # Partials carry no final marker, so drain the stream in C and keep
+        # only the last one, which always holds the full transcript.
+        last_box = deque(_stt().stream_transcribe_file(audio_path), maxlen=1)
+        last = last_box[0].text if last_box else ""
+        logger.debug("Playground transcript chars=%s", len(last))
+        return last
+
+    await stt_q.put(await asyncio.to_thread(transcribe))
+
+
+async def _llm_stage(stt_q: asyncio.Queue[str], llm_q: asyncio.Queue[str | None]) -> None:
+    """Stream the answer and flush it to the TTS stage sentence by sentence."""
+    prompt = await stt_q.get()
+    buffer = ""
+    # Not a `finally`: on cancellation the TTS stage is being torn down too,
+    # and a put on the full queue would block the cancellation forever.
+    try:
+        async for delta in generate_answer(prompt):
+            sentences, buffer = _take_sentences(buffer + delta)
+            if sentences:
+                await llm_q.put(sentences)
+            elif buffer.count(" ") >= _MAX_SENTENCE_WORDS:
+                await llm_q.put(buffer)
+                buffer = ""
+        if buffer.strip():
+            await llm_q.put(buffer)
+    except Exception:
+        await llm_q.put(None)
+        raise
+    await llm_q.put(None)
+
+
+def _discard(task: asyncio.Task[bytes]) -> None:
+    """Cancel `task`, or retrieve its exception if it already failed."""
+    if not task.cancel() and not task.cancelled():
+        task.exception()
+
+
+async def _tts_stage(llm_q: asyncio.Queue[str | None], output_path: Path) -> None:
+    """
+    Synthesize sentences concurrently and write the audio in sentence order.
+
+    At most `_TTS_CONCURRENCY` ElevenLabs requests run at once. Segments are
+    awaited in submission order, so a fast later sentence waits for the ones
+    before it and the output file always plays back in order.
+    """
+    semaphore = asyncio.Semaphore(_TTS_CONCURRENCY)
+    segments: asyncio.Queue[asyncio.Task[bytes] | None] = asyncio.Queue(
+        maxsize=_PIPELINE_QUEUE_SIZE
+    )
+
+    async def synthesize(sentence: str) -> bytes:
+        async with semaphore:
+            return await asyncio.to_thread(synthesize_speech_elevenlabs, sentence)
+
+    async def write_in_order() -> None:
+        with output_path.open("wb") as output:
+            index = 0
+            while (segment := await segments.get()) is not None:
+                output.write(await segment)
+                output.flush()
+                logger.info("TTS segment ready index=%s path=%s", index, output_path)
+                index += 1
+
+    writer = asyncio.create_task(write_in_order())
+
+    async def submit(segment: asyncio.Task[bytes] | None) -> None:
+        # Race the put against the writer: once the writer has failed nobody
+        # drains `segments`, and a put on the full queue would never return.
+        put = asyncio.create_task(segments.put(segment))
+        await asyncio.wait((put, writer), return_when=asyncio.FIRST_COMPLETED)
+        if not put.done():
+            put.cancel()
+            if segment is not None:
+                _discard(segment)
+
+    try:
+        while not writer.done() and (sentence := await llm_q.get()) is not None:
+            await submit(asyncio.create_task(synthesize(sentence)))
+        if not writer.done():
+            await submit(None)
+        await writer
+    finally:
+        # Synthesis still queued behind a failed or cancelled writer is moot.
+        writer.cancel()
+        while not segments.empty():
+            segment = segments.get_nowait()
+            if segment is not None:
+                _discard(segment)
+
+
+async def run_voice_turn(audio_path: Path, output_path: Path = SPEECH_FILE_PATH) -> None:
+    """Run one STT -> LLM -> TTS turn with the three stages overlapping."""
+    stt_q: asyncio.Queue[str] = asyncio.Queue()
+    llm_q: asyncio.Queue[str | None] = asyncio.Queue(maxsize=_PIPELINE_QUEUE_SIZE)
+    with log_activity(
+        logger,
+        "playground.voice_turn",
+        details={"audio_path": str(audio_path), "output_path": str(output_path)},
+    ):
+        stages = [
+            asyncio.create_task(_stt_stage(audio_path, stt_q)),
+            asyncio.create_task(_llm_stage(stt_q, llm_q)),
+            asyncio.create_task(_tts_stage(llm_q, output_path)),
+        ]
+        try:
+            await asyncio.gather(*stages)
+        except BaseException:
+            # A failed stage leaves its neighbours blocked on the bounded
+            # queues; cancel them so the error surfaces instead of a hang.
+            for stage in stages:
+                stage.cancel()
+            await asyncio.gather(*stages, return_exceptions=True)
+            raise
+
+
 if __name__ == "__main__":
     #example_streaming_transcription()
     logger.info("Launching playground demo")
-    last = ""
-    for partial in STTOpenAI().stream_transcribe_file(Path("vad_recording.wav")):
-        last = partial.text
-        logger.debug("Playground stream partial chars=%s", len(partial.text))
-    for answer in generate_answer(last):
-        logger.debug("LLM answer chunk chars=%s", len(answer))
-    
-    generate_speech_elevenlabs(answer)
+    asyncio.run(run_voice_turn(Path("vad_recording.wav")))
     logger.info("TTS file updated")
@@ -1,20 +1,21 @@
-import json
-from openai import OpenAI
-from openai.types.responses import ResponseCreatedEvent, ResponseFunctionCallArgumentsDeltaEvent, ResponseFunctionToolCall, ResponseOutputItemAddedEvent, ResponseOutputItemDoneEvent, ResponseTextDeltaEvent
+import logging
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Optional
 
-from core.config import get_config
+import orjson
+from openai.types.responses import ResponseCreatedEvent, ResponseFunctionCallArgumentsDeltaEvent, ResponseOutputItemAddedEvent, ResponseOutputItemDoneEvent, ResponseTextDeltaEvent
+
+from core.clients import async_openai_client
 from core.logging_utils import get_logger, log_activity
 
 logger = get_logger(__name__)
 
+# Per-token debug logging is coalesced into one line per this many chunks.
+_DELTA_LOG_INTERVAL = 64
+# Upper bound, in characters, on one tool call's streamed arguments, so a
+# runaway response cannot grow the buffer without limit.
+_MAX_TOOL_ARG_CHARS = 65_536
 
-def _char_count(value) -> int:
-    if value is None:
-        return 0
-    try:
-        return len(value)  # type: ignore[arg-type]
-    except TypeError:
-        return len(str(value))
 
 tools = [
     {
@@ -37,43 +38,122 @@ tools = [
 def get_horoscope(sign):
     return f"{sign}: Next Tuesday you will befriend a baby otter."
 
-def generate_answer(prompt: str) -> str:
-    config = get_config()
-    client = OpenAI(api_key=config.openai_api_key)
+
+# Tool name -> implementation; add new tools here alongside their schema above.
+_TOOL_IMPLS: dict[str, Callable[..., str]] = {
+    "get_horoscope": get_horoscope,
+}
+
+@dataclass(slots=True)
+class _ToolCallBuffer:
+    """A streamed tool call and its argument deltas."""
+
+    item: Any
+    chunks: list[str] = field(default_factory=list)
+    chars: int = 0
+
+
+# Indexed by `output_index`; streams use a small dense range (0, 1, 2, ...),
+# so a list beats a dict here. Slots for non-tool items stay None.
+ToolCalls = list[Optional[_ToolCallBuffer]]
+
+
+def _tool_call_entry(tool_calls: ToolCalls, index: int) -> Optional[_ToolCallBuffer]:
+    return tool_calls[index] if index < len(tool_calls) else None
+
+
+# Stream event handlers, keyed by the SDK's `event.type` discriminator. Each
+# returns the text to emit downstream, or None. A dict lookup per event is
+# cheaper than walking an isinstance chain at token rate.
+def _on_created(event: ResponseCreatedEvent, tool_calls: ToolCalls) -> Optional[str]:
+    logger.info("Response stream created")
+    return None
+
+
+def _on_text_delta(event: ResponseTextDeltaEvent, tool_calls: ToolCalls) -> Optional[str]:
+    return event.delta
+
+
+def _on_item_done(event: ResponseOutputItemDoneEvent, tool_calls: ToolCalls) -> Optional[str]:
+    if event.item.type == "function_call":
+        fn = _TOOL_IMPLS.get(event.item.name)
+        if fn is not None:
+            entry = _tool_call_entry(tool_calls, event.output_index)
+            arguments = (entry is not None and "".join(entry.chunks)) or event.item.arguments
+            result = fn(**orjson.loads(arguments))
+            logger.info("Called tool", extra={"tool": event.item.name, "arguments": arguments, "result": result})
+            return result
+    else:
+        # The deltas already carried this text; only log it.
+        text = event.item.content[0].text
+        logger.info("LLM response complete", extra={"chars": len(text)})
+    return None
+
+
+def _on_item_added(event: ResponseOutputItemAddedEvent, tool_calls: ToolCalls) -> Optional[str]:
+    # Argument deltas are collected in a list and joined once when the call
+    # completes, instead of re-copying the string per delta.
+    index = event.output_index
+    if index >= len(tool_calls):
+        tool_calls.extend([None] * (index + 1 - len(tool_calls)))
+    tool_calls[index] = _ToolCallBuffer(event.item)
+    return None
+
+
+def _on_arguments_delta(
+    event: ResponseFunctionCallArgumentsDeltaEvent, tool_calls: ToolCalls
+) -> Optional[str]:
+    entry = _tool_call_entry(tool_calls, event.output_index)
+    if entry is not None:
+        entry.chars += len(event.delta)
+        if entry.chars > _MAX_TOOL_ARG_CHARS:
+            raise ValueError("tool argument payload exceeds limit")
+        entry.chunks.append(event.delta)
+    return None
+
+
+_HANDLERS: dict[str, Callable[[Any, ToolCalls], Optional[str]]] = {
+    "response.created": _on_created,
+    "response.output_text.delta": _on_text_delta,
+    "response.output_item.done": _on_item_done,
+    "response.output_item.added": _on_item_added,
+    "response.function_call_arguments.delta": _on_arguments_delta,
+}
+
+
+async def generate_answer(prompt: str) -> AsyncIterator[str]:
+    client = async_openai_client()
     with log_activity(
         logger,
         "llm.generate_answer",
         details={"chars": len(prompt)},
     ):
         text = "I am a Aquarius, what is my horoscope"
-        final_tool_calls = {}
-        stream = client.responses.create(
+        final_tool_calls: ToolCalls = []
+        stream = await client.responses.create(
             model="gpt-4o-mini",
             input=text,
             tools=tools,
             instructions="You are a helpful assistant.",
             stream=True
         )
-        for event in stream:
-            if isinstance(event, ResponseCreatedEvent):
-                logger.info("Response stream created")
-            elif isinstance(event, ResponseTextDeltaEvent):
-                logger.debug("Streaming text delta", extra={"chars": _char_count(event.delta)})
-                yield event.delta
-            elif isinstance(event, ResponseOutputItemDoneEvent):
-                if event.item.type == "function_call":
-                    if event.item.name == "get_horoscope":
-                        result = get_horoscope(**json.loads(event.item.arguments))
-                        logger.info("Called tool", extra={"tool": event.item.name, "arguments": event.item.arguments, "result": result})
-                        yield result
-                        
-                else:
-                    text = event.item.content[0].text
-                    logger.info("LLM response complete", extra={"chars": _char_count(text)})
-                    yield text
-            elif isinstance(event, ResponseOutputItemAddedEvent):
-                final_tool_calls[event.output_index] = event.item;
-            elif isinstance(event, ResponseFunctionCallArgumentsDeltaEvent):
-                index = event.output_index
-                if final_tool_calls[index]:
-                    final_tool_calls[index].arguments += event.delta
+        handlers = _HANDLERS
+        debug = logger.isEnabledFor(logging.DEBUG)
+        chunks = chars = 0
+        try:
+            async for event in stream:
+                handler = handlers.get(event.type)
+                if handler is not None:
+                    value = handler(event, final_tool_calls)
+                    if value is not None:
+                        chunks += 1
+                        chars += len(value)
+                        if debug and chunks % _DELTA_LOG_INTERVAL == 0:
+                            logger.debug("Streaming answer", extra={"chunks": chunks, "chars": chars})
+                        yield value
+        finally:
+            # Release the HTTP response if we stop early (oversized tool
+            # arguments, a handler error or an abandoned generator).
+            await stream.close()
+        if debug:
+            logger.debug("Streamed answer", extra={"chunks": chunks, "chars": chars})
@@ -0,0 +1,48 @@
+from types import SimpleNamespace
+from pathlib import Path
+import asyncio
+import sys
+
+project_root = str(Path(__file__).resolve().parents[1])
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+import core.clients as clients_module
+
+
+def test_async_openai_client_is_rebuilt_per_event_loop(monkeypatch):
+    monkeypatch.setattr(clients_module, "get_config", lambda: SimpleNamespace(openai_api_key="test-key"))
+    monkeypatch.setattr(clients_module, "_ASYNC_OPENAI", None)
+
+    async def fetch_twice():
+        return clients_module.async_openai_client(), clients_module.async_openai_client()
+
+    first, again = asyncio.run(fetch_twice())
+    second, _ = asyncio.run(fetch_twice())
+
+    assert first is again
+    assert second is not first
+
+
+def test_openai_client_is_shared_and_carries_organization(monkeypatch):
+    import openai
+
+    created: list[dict] = []
+
+    class FakeOpenAI:
+        def __init__(self, **kwargs) -> None:
+            created.append(kwargs)
+
+    monkeypatch.setattr(openai, "OpenAI", FakeOpenAI)
+    monkeypatch.setattr(
+        clients_module,
+        "get_config",
+        lambda: SimpleNamespace(openai_api_key="test-key", openai_organization="org-123"),
+    )
+    clients_module.openai_client.cache_clear()
+    try:
+        assert clients_module.openai_client() is clients_module.openai_client()
+    finally:
+        clients_module.openai_client.cache_clear()
+
+    assert created == [{"api_key": "test-key", "organization": "org-123"}]
@@ -0,0 +1,105 @@
+from types import SimpleNamespace
+from pathlib import Path
+import asyncio
+import sys
+
+import pytest
+
+project_root = str(Path(__file__).resolve().parents[1])
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+import llm.openai as llm_module
+
+
+class FakeResponseStream:
+    def __init__(self, events: list) -> None:
+        self._events = iter(events)
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._events)
+        except StopIteration:
+            raise StopAsyncIteration
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def install_stream(monkeypatch, events: list) -> FakeResponseStream:
+    stream = FakeResponseStream(events)
+
+    async def fake_create(**kwargs):
+        return stream
+
+    client = SimpleNamespace(responses=SimpleNamespace(create=fake_create))
+    monkeypatch.setattr(llm_module, "async_openai_client", lambda: client)
+    return stream
+
+
+def collect(prompt: str) -> list[str]:
+    async def run() -> list[str]:
+        return [chunk async for chunk in llm_module.generate_answer(prompt)]
+
+    return asyncio.run(run())
+
+
+def tool_call_started() -> SimpleNamespace:
+    return SimpleNamespace(
+        type="response.output_item.added",
+        output_index=0,
+        item=SimpleNamespace(type="function_call"),
+    )
+
+
+def arguments_delta(delta: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        type="response.function_call_arguments.delta", output_index=0, delta=delta
+    )
+
+
+def test_generate_answer_streams_tool_result_and_text(monkeypatch):
+    stream = install_stream(
+        monkeypatch,
+        [
+            SimpleNamespace(type="response.created"),
+            tool_call_started(),
+            arguments_delta('{"sign":'),
+            arguments_delta('"Aquarius"}'),
+            SimpleNamespace(
+                type="response.output_item.done",
+                output_index=0,
+                item=SimpleNamespace(
+                    type="function_call",
+                    name="get_horoscope",
+                    arguments='{"sign":"Aquarius"}',
+                ),
+            ),
+            SimpleNamespace(type="response.output_text.delta", delta="Hi."),
+        ],
+    )
+
+    assert collect("prompt") == [
+        "Aquarius: Next Tuesday you will befriend a baby otter.",
+        "Hi.",
+    ]
+    assert stream.closed
+
+
+def test_generate_answer_rejects_oversized_tool_arguments(monkeypatch):
+    stream = install_stream(
+        monkeypatch,
+        [
+            tool_call_started(),
+            arguments_delta('{"sign": "'),
+            arguments_delta("x" * llm_module._MAX_TOOL_ARG_CHARS),
+        ],
+    )
+
+    with pytest.raises(ValueError, match="tool argument payload exceeds limit"):
+        collect("prompt")
+    assert stream.closed
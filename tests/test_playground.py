@@ -0,0 +1,90 @@
+from types import SimpleNamespace
+from pathlib import Path
+import asyncio
+import sys
+import threading
+import time
+
+import pytest
+
+project_root = str(Path(__file__).resolve().parents[1])
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+import core.playground as playground
+from core import TranscribedText
+
+
+def install_turn(monkeypatch, answer: list[str]) -> None:
+    fake_stt = SimpleNamespace(
+        stream_transcribe_file=lambda path: iter([TranscribedText(text="prompt", confidence=1.0)])
+    )
+
+    async def fake_generate_answer(prompt: str):
+        for delta in answer:
+            yield delta
+
+    monkeypatch.setattr(playground, "_stt", lambda: fake_stt)
+    monkeypatch.setattr(playground, "generate_answer", fake_generate_answer)
+
+
+def test_run_voice_turn_writes_segments_in_sentence_order(monkeypatch, tmp_path):
+    answer = ["First sen", "tence. ", "Second one", "! Third", "? Fourth. Fifth. ", "Sixth", " and a tail"]
+    install_turn(monkeypatch, answer)
+
+    lock = threading.Lock()
+    active = peak = 0
+    segment_count = 0
+
+    def slow_tts(text: str) -> bytes:
+        nonlocal active, peak, segment_count
+        with lock:
+            active += 1
+            peak = max(peak, active)
+            segment_count += 1
+            # Earlier sentences take longest, so they finish out of order.
+            delay = 0.05 / segment_count
+        time.sleep(delay)
+        with lock:
+            active -= 1
+        return text.encode()
+
+    monkeypatch.setattr(playground, "synthesize_speech_elevenlabs", slow_tts)
+    output_path = tmp_path / "speech.mp3"
+
+    asyncio.run(asyncio.wait_for(playground.run_voice_turn(Path("unused.wav"), output_path), 5))
+
+    # Every sentence, including the unterminated tail, lands in the file in order.
+    assert output_path.read_bytes() == "".join(answer).encode()
+    assert segment_count > playground._TTS_CONCURRENCY
+    assert peak == playground._TTS_CONCURRENCY
+
+
+def test_run_voice_turn_fails_fast_when_tts_fails(monkeypatch, tmp_path):
+    install_turn(monkeypatch, [f"Sentence number {index}. " for index in range(20)])
+
+    def failing_tts(text: str) -> bytes:
+        raise RuntimeError("tts unavailable")
+
+    monkeypatch.setattr(playground, "synthesize_speech_elevenlabs", failing_tts)
+
+    async def run() -> None:
+        await asyncio.wait_for(
+            playground.run_voice_turn(Path("unused.wav"), tmp_path / "speech.mp3"), 5
+        )
+
+    with pytest.raises(RuntimeError, match="tts unavailable"):
+        asyncio.run(run())
+
+
+def test_take_sentences_waits_for_whitespace_after_terminator():
+    buffer = ""
+    flushed: list[str] = []
+    for delta in ["It costs 3", ".", "14 dollars", ". Well", ".", "..", " bye", "."]:
+        sentences, buffer = playground._take_sentences(buffer + delta)
+        if sentences:
+            flushed.append(sentences)
+
+    assert flushed == ["It costs 3.14 dollars.", " Well..."]
+    # The trailing sentence is left for the end-of-stream flush.
+    assert buffer == " bye."
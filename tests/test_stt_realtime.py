@@ -1,13 +1,17 @@
 from types import SimpleNamespace
 from pathlib import Path
 import json
+import math
+import re
+import socket
 import sys
+import wave
 
 project_root = str(Path(__file__).resolve().parents[1])
 if project_root not in sys.path:
     sys.path.append(project_root)
 
-from audio_output.stt import STTOpenAI, _merge_transcript
+from audio_output.stt import STTOpenAI, _iter_wav_chunks, _merge_transcript, _to_realtime_pcm
 from core import AudioChunk, TranscribedText
 
 
@@ -25,20 +29,35 @@ class DummyOpenAI:
         )
 
 
+_TYPE_FIELD = re.compile(r'"type":\s*"([^"]+)"')
+
+
 class FakeWebSocket:
     def __init__(self, events: list[dict]) -> None:
         self.events = events
-        self.sent_messages: list[dict] = []
+        # Raw frames; append frames embed large base64 blobs, so only parse
+        # what an assertion actually needs.
+        self.sent_messages: list[str] = []
         self.timeout_values: list[float | None] = []
         self.closed = False
+        # A real socket the client can select on; the unread byte keeps it
+        # readable so every recv() goes through to `events`.
+        self.sock, self._peer = socket.socketpair()
+        self._peer.send(b"\0")
 
     def send(self, message: str) -> None:
-        self.sent_messages.append(json.loads(message))
+        self.sent_messages.append(message)
+
+    def message_types(self) -> list[str]:
+        # The envelope's own "type" is always its first key.
+        return [_TYPE_FIELD.search(message).group(1) for message in self.sent_messages]
 
     def recv(self):
         if not self.events:
             return None
         event = self.events.pop(0)
+        if isinstance(event, Exception):
+            raise event
         return json.dumps(event)
 
     def settimeout(self, value: float | None) -> None:
@@ -46,11 +65,13 @@ class FakeWebSocket:
 
     def close(self) -> None:
         self.closed = True
+        self.sock.close()
+        self._peer.close()
 
 
-def make_chunk() -> AudioChunk:
+def make_chunk(frames: int = 4096) -> AudioChunk:
     return AudioChunk(
-        data=b"\x01\x00" * 4096,
+        data=b"\x01\x00" * frames,
         sample_rate=16_000,
         timestamp=0.0,
         channels=1,
@@ -90,12 +111,14 @@ def test_stream_transcribe_realtime(monkeypatch):
     assert [res.text for res in results] == ["hi", "hi there"]
 
     # Ensure audio was appended and commits were issued (per chunk + final)
-    message_types = [msg["type"] for msg in fake_ws.sent_messages]
+    message_types = fake_ws.message_types()
     assert "session.update" in message_types
     assert message_types.count("input_audio_buffer.append") >= 1
     assert message_types.count("input_audio_buffer.commit") >= 2
 
-    session_updates = [msg for msg in fake_ws.sent_messages if msg["type"] == "session.update"]
+    session_updates = [
+        json.loads(msg) for msg in fake_ws.sent_messages if '"session.update"' in msg
+    ]
     assert session_updates
     session_body = session_updates[0]["session"]
     assert session_body["type"] == "transcription"
@@ -103,9 +126,185 @@ def test_stream_transcribe_realtime(monkeypatch):
     assert transcription_cfg["model"] == "gpt-4o-transcribe"
     assert transcription_cfg["prompt"] == "test"
 
+    # The read timeout is configured once per session, not around each recv.
+    assert len(fake_ws.timeout_values) <= 2
     assert fake_ws.closed
 
 
+def test_stream_transcribe_waits_through_read_timeouts(monkeypatch):
+    import audio_output.stt as stt_module
+
+    class FakeTimeout(Exception):
+        pass
+
+    fake_ws = FakeWebSocket(
+        [
+            {"type": "input_audio_buffer.committed", "item_id": "item_001"},
+            FakeTimeout(),
+            FakeTimeout(),
+            {
+                "type": "conversation.item.input_audio_transcription.completed",
+                "item_id": "item_001",
+                "transcript": "hi there",
+            },
+        ]
+    )
+    monkeypatch.setattr(stt_module, "websocket", SimpleNamespace(create_connection=lambda *a, **k: fake_ws))
+    monkeypatch.setattr(stt_module, "WebSocketTimeoutException", FakeTimeout)
+    monkeypatch.setattr(stt_module, "OpenAI", DummyOpenAI)
+    monkeypatch.setattr(stt_module, "get_config", lambda: DummyConfig())
+
+    stt = STTOpenAI()
+    generator = stt.stream_transcribe([], instructions="test")
+    try:
+        while True:
+            next(generator)
+    except StopIteration as stop:
+        final = stop.value
+
+    # Timeouts before the deadline are heartbeats, not the end of the wait.
+    assert final.text == "hi there"
+    assert not fake_ws.events
+    assert fake_ws.timeout_values == [stt_module._SOCKET_TIMEOUT_S]
+
+
+def test_stream_transcribe_batches_appends(monkeypatch):
+    import audio_output.stt as stt_module
+
+    fake_ws = FakeWebSocket([])
+    monkeypatch.setattr(stt_module, "websocket", SimpleNamespace(create_connection=lambda *a, **k: fake_ws))
+    monkeypatch.setattr(stt_module, "OpenAI", DummyOpenAI)
+    monkeypatch.setattr(stt_module, "get_config", lambda: DummyConfig())
+
+    chunk_ms, batch_ms, num_chunks = 20, 200, 45
+    # A generous delay budget so only the size threshold triggers flushes,
+    # however slowly the loop runs.
+    stt = STTOpenAI(append_batch_ms=batch_ms, append_max_delay_s=60.0)
+    chunks = [make_chunk(frames=16_000 * chunk_ms // 1000) for _ in range(num_chunks)]
+    list(stt.stream_transcribe(chunks, instructions="test"))
+
+    message_types = fake_ws.message_types()
+    appends = message_types.count("input_audio_buffer.append")
+    assert 1 <= appends <= math.ceil(num_chunks * chunk_ms / batch_ms)
+    assert message_types[-1] == "input_audio_buffer.commit"
+    assert message_types.count("input_audio_buffer.commit") == 1
+
+
+def test_stream_transcribe_file_uses_realtime_for_large_wav(monkeypatch, tmp_path):
+    import audio_output.stt as stt_module
+
+    audio_path = tmp_path / "long.wav"
+    with wave.open(str(audio_path), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(16_000)
+        wav_file.writeframes(b"\x01\x00" * 16_000 * 40)
+
+    fake_ws = FakeWebSocket(
+        [
+            {"type": "input_audio_buffer.committed", "item_id": "item_001"},
+            {
+                "type": "conversation.item.input_audio_transcription.completed",
+                "item_id": "item_001",
+                "transcript": "long recording",
+            },
+        ]
+    )
+    monkeypatch.setattr(stt_module, "websocket", SimpleNamespace(create_connection=lambda *a, **k: fake_ws))
+    monkeypatch.setattr(stt_module, "OpenAI", DummyOpenAI)
+    monkeypatch.setattr(stt_module, "get_config", lambda: DummyConfig())
+
+    stt = STTOpenAI()
+    generator = stt.stream_transcribe_file(audio_path, model="whisper-1", language="en")
+    partials: list[TranscribedText] = []
+    try:
+        while True:
+            partials.append(next(generator))
+    except StopIteration as stop:
+        final = stop.value
+
+    assert final.text == "long recording"
+    assert fake_ws.message_types().count("input_audio_buffer.append") >= 1
+    session_update = json.loads(fake_ws.sent_messages[0])
+    transcription_cfg = session_update["session"]["audio"]["input"]["transcription"]
+    assert transcription_cfg["model"] == "whisper-1"
+    assert transcription_cfg["language"] == "en"
+    assert partials and all(partial.language == "en" for partial in partials)
+    assert final.language == "en"
+    assert fake_ws.closed
+
+
+def test_stream_transcribe_file_transcribes_while_uploading(monkeypatch, tmp_path):
+    import audio_output.stt as stt_module
+
+    audio_path = tmp_path / "long.wav"
+    with wave.open(str(audio_path), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(16_000)
+        wav_file.writeframes(b"\x01\x00" * 16_000 * 40)
+
+    class CommitGatedWebSocket(FakeWebSocket):
+        # Like the server with turn detection off: nothing is transcribed
+        # until audio has been committed.
+        def recv(self):
+            if "input_audio_buffer.commit" not in self.message_types():
+                return None
+            return super().recv()
+
+    fake_ws = CommitGatedWebSocket(
+        [
+            {"type": "input_audio_buffer.committed", "item_id": "item_001"},
+            {
+                "type": "conversation.item.input_audio_transcription.completed",
+                "item_id": "item_001",
+                "transcript": "first segment",
+            },
+        ]
+    )
+    monkeypatch.setattr(stt_module, "websocket", SimpleNamespace(create_connection=lambda *a, **k: fake_ws))
+    monkeypatch.setattr(stt_module, "OpenAI", DummyOpenAI)
+    monkeypatch.setattr(stt_module, "get_config", lambda: DummyConfig())
+
+    stt = STTOpenAI()
+    appends_at_first_partial = None
+    for partial in stt.stream_transcribe_file(audio_path):
+        if appends_at_first_partial is None:
+            appends_at_first_partial = fake_ws.message_types().count("input_audio_buffer.append")
+
+    message_types = fake_ws.message_types()
+    assert partial.text == "first segment"
+    assert message_types.count("input_audio_buffer.commit") > 1
+    assert message_types.index("input_audio_buffer.commit") < len(message_types) - 1
+    assert appends_at_first_partial < message_types.count("input_audio_buffer.append")
+
+
+def test_iter_wav_chunks_converts_unsigned_8bit_samples(tmp_path):
+    audio_path = tmp_path / "silence8.wav"
+    with wave.open(str(audio_path), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(1)
+        wav_file.setframerate(24_000)
+        wav_file.writeframes(b"\x80" * 8)
+
+    chunks = list(_iter_wav_chunks(audio_path))
+    pcm, _ = _to_realtime_pcm(chunks[0], None)
+
+    # Unsigned 8-bit silence (0x80) must stay silence in PCM16.
+    assert pcm == b"\x00\x00" * 8
+
+
+def test_stt_uses_shared_openai_client_by_default(monkeypatch):
+    import audio_output.stt as stt_module
+
+    shared_client = object()
+    monkeypatch.setattr(stt_module, "OpenAI", None)
+    monkeypatch.setattr(stt_module, "openai_client", lambda: shared_client)
+    monkeypatch.setattr(stt_module, "get_config", lambda: DummyConfig())
+
+    assert STTOpenAI()._client is shared_client
+
+
 def test_merge_transcript_handles_final_overwrite():
     base = "hi"
     rewritten = _merge_transcript(base, "hi there", True)
@@ -118,12 +317,15 @@ def test_stream_transcribe_file_streaming(monkeypatch, tmp_path):
     audio_path = tmp_path / "sample.wav"
     audio_path.write_bytes(b"fake-audio")
 
-    fake_stream_events = ["hi", " there"]
+    fake_stream_events = [
+        SimpleNamespace(type="transcript.text.delta", delta="hi"),
+        SimpleNamespace(type="transcript.text.delta", delta=" there"),
+        SimpleNamespace(type="transcript.text.done", text="hi there"),
+    ]
 
     class FakeStream:
         def __init__(self) -> None:
             self._events = iter(fake_stream_events)
-            self.final_response = SimpleNamespace(text="hi there")
 
         def __iter__(self):
             return self
@@ -147,9 +349,7 @@ def test_stream_transcribe_file_streaming(monkeypatch, tmp_path):
         )
     )
 
-    generator = stt.stream_transcribe_file(
-        audio_path, model="gpt-4o-mini-transcribe"
-    )
+    generator = stt.stream_transcribe_file(audio_path, model="gpt-4o-transcribe")
 
     partials: list[TranscribedText] = []
     try:
@@ -162,5 +362,31 @@ def test_stream_transcribe_file_streaming(monkeypatch, tmp_path):
     assert final.text == "hi there"
 
     assert captured_kwargs["stream"] is True
-    assert captured_kwargs["response_format"] == "text"
-    assert captured_kwargs["model"] == "gpt-4o-mini-transcribe"
+    assert captured_kwargs["model"] == "gpt-4o-transcribe"
+
+
+def test_transcribe_chunk_uploads_in_memory_wav(monkeypatch):
+    import audio_output.stt as stt_module
+
+    monkeypatch.setattr(stt_module, "OpenAI", DummyOpenAI)
+    monkeypatch.setattr(stt_module, "get_config", lambda: DummyConfig())
+
+    captured_kwargs: dict[str, object] = {}
+
+    def fake_create(*args, **kwargs):
+        captured_kwargs.update(kwargs)
+        return SimpleNamespace(text="hello", language="en")
+
+    stt = STTOpenAI()
+    stt._client = SimpleNamespace(
+        audio=SimpleNamespace(transcriptions=SimpleNamespace(create=fake_create))
+    )
+
+    result = stt.transcribe_chunk(make_chunk())
+
+    assert result.text == "hello"
+    assert result.language == "en"
+    filename, payload, mimetype = captured_kwargs["file"]
+    assert (filename, mimetype) == ("audio.wav", "audio/wav")
+    assert payload[:4] == b"RIFF"
+    assert captured_kwargs["model"] == "gpt-4o-transcribe"